@@ -2,6 +2,8 @@ const path = require("path");
 const CampaignProcessor = require("../lib/campaignProcessor");
 
 async function main() {
+    // Take the run timestamp once so both reports share the same suffix
+    const runTimestamp = Date.now();
     const config = {
         inputPath: path.join(process.cwd(), "data", "uploads", "current.csv"),
         historyPath: path.join(process.cwd(), "data", "history", "latest.json"),
@@ -9,13 +11,13 @@ async function main() {
             process.cwd(),
             "data",
             "output",
-            `report_${Date.now()}.md`
+            `report_${runTimestamp}.md`
         ),
         textPath: path.join(
             process.cwd(),
             "data",
             "output",
-            `report_${Date.now()}.txt`
+            `report_${runTimestamp}.txt`
         ),
     };
 
@@ -2,6 +2,7 @@ import { NextResponse } from "next/server";
 import { writeFile } from "fs/promises";
 import path from "path";
 import { spawn } from "child_process";
+import { randomBytes } from "crypto";
 import yaml from "yaml";
 
 // Helper function to run Python script
@@ -18,20 +19,24 @@ async function runPythonScript(configPath: string): Promise<any> {
             configPath,
         ]);
 
-        let stdout = "";
-        let stderr = "";
+        // Collect raw chunks and decode once on close, so multi-byte
+        // characters split across chunks are not mangled
+        const stdoutChunks: Buffer[] = [];
+        const stderrChunks: Buffer[] = [];
 
-        pythonProcess.stdout.on("data", (data) => {
-            stdout += data.toString();
+        pythonProcess.stdout.on("data", (data: Buffer) => {
+            stdoutChunks.push(data);
             console.log(`Python stdout: ${data}`);
         });
 
-        pythonProcess.stderr.on("data", (data) => {
-            stderr += data.toString();
+        pythonProcess.stderr.on("data", (data: Buffer) => {
+            stderrChunks.push(data);
             console.log(`Python stderr: ${data}`);
         });
 
         pythonProcess.on("close", (code) => {
+            const stdout = Buffer.concat(stdoutChunks).toString("utf-8");
+            const stderr = Buffer.concat(stderrChunks).toString("utf-8");
             console.log("Python process completed with code:", code);
             console.log("stdout:", stdout);
             console.log("stderr:", stderr);
@@ -75,15 +80,20 @@ export async function POST(request: Request) {
         const configDir = path.join(process.cwd(), "data", "config");
         const outputDir = path.join(process.cwd(), "data", "output");
 
-        // Generate unique filename
-        const timestamp = new Date().toISOString().replace(/[^0-9]/g, "");
+        // Generate unique filename; the random suffix keeps requests in the
+        // same millisecond apart, so the exclusive-create writes below only
+        // fail on a genuine clash
+        const timestamp = `${new Date()
+            .toISOString()
+            .replace(/[^0-9]/g, "")}_${randomBytes(4).toString("hex")}`;
         const filename = `campaign_report_${timestamp}.csv`;
         const filepath = path.join(uploadsDir, filename);
 
-        // Write the uploaded file
+        // Write the uploaded file; "wx" fails instead of clobbering an
+        // existing upload with the same name
         const bytes = await file.arrayBuffer();
         const buffer = Buffer.from(bytes);
-        await writeFile(filepath, buffer);
+        await writeFile(filepath, buffer, { flag: "wx" });
 
         // Create config file for this run
         const configData = {
@@ -101,7 +111,9 @@ export async function POST(request: Request) {
         };
 
         const configPath = path.join(configDir, `config_${timestamp}.yaml`);
-        await writeFile(configPath, yaml.stringify(configData));
+        await writeFile(configPath, yaml.stringify(configData), {
+            flag: "wx",
+        });
 
         console.log("Running Python script with config:", configPath);
         const result = await runPythonScript(configPath);